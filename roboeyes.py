@@ -8,11 +8,20 @@ Designed for ST7789 displays (240x320) on Raspberry Pi 5.
 import time
 import random
 import math
+import functools
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Optional, Tuple, Callable
+from typing import Optional, Tuple, Callable, Union
+import numpy as np
+# Only Image.new, paste and ImageDraw primitives are used (no Resampling enum),
+# so pillow-simd can replace Pillow as-is: pip uninstall pillow && pip install pillow-simd
 from PIL import Image, ImageDraw
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 class Mood(Enum):
     DEFAULT = "default"
@@ -33,6 +42,45 @@ class Position(Enum):
     NW = "nw"
 
 
+# Idle mode picks from these on every idle tick
+_POSITIONS = tuple(Position)
+
+# look() direction names
+_LOOK_DIRECTIONS = {
+    "center": Position.DEFAULT,
+    "default": Position.DEFAULT,
+    "n": Position.N, "north": Position.N, "up": Position.N,
+    "ne": Position.NE, "northeast": Position.NE,
+    "e": Position.E, "east": Position.E, "right": Position.E,
+    "se": Position.SE, "southeast": Position.SE,
+    "s": Position.S, "south": Position.S, "down": Position.S,
+    "sw": Position.SW, "southwest": Position.SW,
+    "w": Position.W, "west": Position.W, "left": Position.W,
+    "nw": Position.NW, "northwest": Position.NW,
+}
+
+_SWEAT_COLOR = (100, 150, 255)
+
+# (top_mod, bottom_mod) of both eyes for each mood
+_MOOD_MODS = {
+    Mood.DEFAULT: (0.0, 0.0),
+    Mood.HAPPY: (0.0, 0.4),   # Squint from bottom (happy/smiling)
+    Mood.ANGRY: (0.35, 0.0),  # Slant inward from top (angry eyebrows)
+    Mood.TIRED: (0.5, 0.0),   # Droop from top (tired/sleepy)
+}
+
+# One period of sin() in 256 steps for the blink and shake curves;
+# _SIN_LUT[int(t * turns * 256) & 255] is sin(2 * pi * turns * t)
+_SIN_LUT = [math.sin(2 * math.pi * i / 256) for i in range(256)]
+
+_FLICKER_RING = 1024
+
+
+def _flicker_ring(amplitude: int) -> list:
+    """_FLICKER_RING random flicker offsets in [-amplitude, amplitude]."""
+    return [random.randint(-amplitude, amplitude) for _ in range(_FLICKER_RING)]
+
+
 @dataclass
 class EyeConfig:
     """Configuration for a single eye."""
@@ -72,6 +120,130 @@ class EyeState:
     right_bottom_mod: float = 0.0
 
 
+if njit is not None:
+    # Compiled rasterizers that write straight into an HxWxC uint8 frame,
+    # where color holds the C bytes of one pixel (RGB, or big-endian RGB565).
+    # Used instead of the Pillow drawing when numba is installed; shapes
+    # follow the Pillow ones (inclusive boxes) closely but not pixel-exactly.
+
+    @njit(cache=True)
+    def _raster_rounded_rect(buf, x, y, w, h, r, color):
+        """
+        Fill the box [x, y, x + w, y + h] with corners rounded to radius r.
+
+        The same shape as _squashed_eye_mask: a cross of two rectangles plus
+        four corner circles, which overhang the box when r > h / 2. Written
+        as a distance test in doubled coordinates (so the half-pixel center
+        stays integral) with no branches in the inner loop, which lets LLVM
+        vectorize it.
+        """
+        rr4 = 4 * (r * r + r)
+        ex = w - 2 * r  # twice the distance from center to a corner column
+        ey = h - 2 * r  # likewise for rows; negative when corners overhang
+        cy = abs(ey)
+        row0 = max(y + min(0, ey), 0)
+        row1 = min(y + max(h, 2 * r) + 1, buf.shape[0])
+        col0 = max(x, 0)
+        col1 = min(x + w + 1, buf.shape[1])
+        for py in range(row0, row1):
+            ay = abs(2 * (py - y) - h)
+            dy = ay - cy
+            in_rows = ay <= ey
+            for px in range(col0, col1):
+                ax = abs(2 * (px - x) - w)
+                dx = ax - ex
+                if in_rows | ((ax <= ex) & (ay <= h)) | (dx * dx + dy * dy <= rr4):
+                    for c in range(buf.shape[2]):
+                        buf[py, px, c] = color[c]
+
+    @njit(cache=True)
+    def _raster_sweat_drop(buf, x, y, color):
+        """Fill a teardrop: ellipse [x-4, y, x+4, y+8] under a point at y-6."""
+        row0 = max(int(math.floor(y - 6)), 0)
+        row1 = min(int(math.ceil(y + 8)) + 1, buf.shape[0])
+        col0 = max(int(math.floor(x - 4)), 0)
+        col1 = min(int(math.ceil(x + 4)) + 1, buf.shape[1])
+        for py in range(row0, row1):
+            for px in range(col0, col1):
+                ex = (px - x) / 4
+                ey = (py - y - 4) / 4
+                inside = ex * ex + ey * ey <= 1.0
+                if not inside and y - 6 <= py <= y + 2:
+                    inside = abs(px - x) <= 4 * (py - y + 6) / 8
+                if inside:
+                    for c in range(buf.shape[2]):
+                        buf[py, px, c] = color[c]
+
+
+def _pack_rgb565(rgb: np.ndarray, out: np.ndarray):
+    """Pack an HxWx3 uint8 RGB array into an HxWx2 uint8 array of big-endian RGB565."""
+    rgb = rgb.astype(np.uint16)
+    color = ((rgb[..., 0] & 0xF8) << 8) | ((rgb[..., 1] & 0xFC) << 3) | (rgb[..., 2] >> 3)
+    out[..., 0] = color >> 8
+    out[..., 1] = color & 0xFF
+
+
+def _rgb565_pixel(color: Tuple[int, int, int]) -> Tuple[int, int]:
+    """The two big-endian RGB565 bytes of one RGB color."""
+    r, g, b = color
+    value = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+    return value >> 8, value & 0xFF
+
+
+@functools.lru_cache(maxsize=1024)
+def _squashed_eye_mask(width: int, height: int, radius: int) -> Tuple[Image.Image, int]:
+    """
+    Mask of a mood-squashed eye: a rounded polygon with corner circles.
+
+    The corner circles can reach above and below the eye when the radius is
+    more than half the height, so the mask is taller than the eye in that
+    case. Returns (mask, y_lo), where y_lo is the mask's top edge relative to
+    the top of the eye.
+    """
+    y_lo = min(0, height - 2 * radius)
+    y_hi = max(height, 2 * radius)
+    mask = Image.new('1', (width + 1, y_hi - y_lo + 1), 0)
+    draw = ImageDraw.Draw(mask)
+
+    # Same shapes as the original per-frame drawing, with the eye's top at -y_lo
+    top = -y_lo
+    bottom = top + height
+    r = radius
+    draw.polygon([
+        (r, top), (width - r, top),
+        (width, top + r), (width, bottom - r),
+        (width - r, bottom), (r, bottom),
+        (0, bottom - r), (0, top + r),
+    ], fill=1)
+    draw.ellipse([0, top, 2 * r, top + 2 * r], fill=1)
+    draw.ellipse([width - 2 * r, top, width, top + 2 * r], fill=1)
+    draw.ellipse([width - 2 * r, bottom - 2 * r, width, bottom], fill=1)
+    draw.ellipse([0, bottom - 2 * r, 2 * r, bottom], fill=1)
+
+    # Center rectangles; either is empty once the eye is squashed flatter
+    # (or narrower) than its corners
+    if width >= 2 * r:
+        draw.rectangle([r, top, width - r, bottom], fill=1)
+    if height >= 2 * r:
+        draw.rectangle([0, top + r, width, bottom - r], fill=1)
+    return mask, y_lo
+
+
+@functools.lru_cache(maxsize=1024)
+def _plain_eye_mask(width: int, height: int, radius: int) -> Image.Image:
+    """Mask of an unmodified eye: one rounded rectangle filling the mask."""
+    mask = Image.new('1', (width + 1, height + 1), 0)
+    ImageDraw.Draw(mask).rounded_rectangle([0, 0, width, height], radius=radius, fill=1)
+    return mask
+
+
+def _eye_mask(width: float, height: float, radius: float, squashed: bool) -> Tuple[Image.Image, int]:
+    """The cached (mask, y_lo) of an eye, squashed by a mood or plain, at whole-pixel size."""
+    if squashed:
+        return _squashed_eye_mask(round(width), round(height), round(radius))
+    return _plain_eye_mask(round(width), round(height), round(radius)), 0
+
+
 class RoboEyes:
     """
     Animated robot eyes renderer.
@@ -84,6 +256,10 @@ class RoboEyes:
         while True:
             frame = eyes.update()
             # display frame on your screen
+
+    With rgb565=True, update() returns an HxWx2 uint8 array of big-endian
+    RGB565 pixels instead of an Image, ready for ST7789Display.show() or
+    WaveshareDisplay.show().
     """
 
     def __init__(
@@ -92,7 +268,8 @@ class RoboEyes:
         height: int = 320,
         bg_color: Tuple[int, int, int] = (0, 0, 0),
         eye_color: Tuple[int, int, int] = (255, 255, 255),
-        frame_rate: int = 60
+        frame_rate: int = 60,
+        rgb565: bool = False
     ):
         self.width = width
         self.height = height
@@ -129,6 +306,7 @@ class RoboEyes:
         # Current mood and position
         self.mood = Mood.DEFAULT
         self.position = Position.DEFAULT
+        self._offset_table: Optional[dict] = None
 
         # Features
         self.cyclops_mode = False
@@ -149,6 +327,12 @@ class RoboEyes:
         self.h_flicker_amplitude = 2
         self.v_flicker_amplitude = 2
 
+        # Flicker offsets are drawn ahead of time into rings of
+        # _FLICKER_RING values, stepped through one entry per frame
+        self._h_flicker_ring = _flicker_ring(self.h_flicker_amplitude)
+        self._v_flicker_ring = _flicker_ring(self.v_flicker_amplitude)
+        self._flicker_index = 0
+
         # Animation state
         self._animating = False
         self._animation_func: Optional[Callable] = None
@@ -159,6 +343,42 @@ class RoboEyes:
         self._sweat_y = 0.0
         self._sweat_visible = False
 
+        # Frame buffer, reused by every update() instead of allocating a new
+        # image and draw context per frame
+        # In RGB565 mode without numba, only three colors are ever drawn, so
+        # the image is a one-byte-per-pixel palette image ('P') holding
+        # indices into (bg_color, eye_color, sweat) and packed through a
+        # three-entry RGB565 table
+        if rgb565 and njit is None:
+            self._img = Image.new('P', (width, height), 0)
+        else:
+            self._img = Image.new('RGB', (width, height), bg_color)
+        self._draw = ImageDraw.Draw(self._img)
+
+        # With numba, eyes are rasterized into this array instead, and the
+        # changed region is copied into the Image once per frame. In RGB565
+        # mode the array holds panel pixels and no Image is involved.
+        self.rgb565 = rgb565
+        self._fb: Optional[np.ndarray] = None
+        if njit is not None:
+            self._fb = np.empty((height, width, 2 if rgb565 else 3), dtype=np.uint8)
+            self._fb[...] = self._pixel(bg_color)
+
+        # What update() returns: the Image, or an RGB565 array (the frame
+        # array itself, or one packed from the palette image without numba)
+        self._frame = self._img
+        if rgb565:
+            self._frame = self._fb
+            if self._fb is None:
+                self._frame = np.empty((height, width, 2), dtype=np.uint8)
+                self._frame[...] = _rgb565_pixel(bg_color)
+
+        # Inputs of the last rendered frame, and the box it drew into (None
+        # until the next frame must clear the whole buffer)
+        self._last_frame_state = None
+        self._dirty: Optional[list] = None
+        self._cleared_bg = bg_color
+
         # Initialize state
         self._update_eye_dimensions()
         self._schedule_next_blink()
@@ -172,6 +392,8 @@ class RoboEyes:
         self.state.right_width = self.right_eye.width
         self.state.right_height = self.right_eye.height
         self.state.right_radius = self.right_eye.border_radius
+        self._offset_table = None
+        self._masks_ready = False
 
     # === Configuration Methods ===
 
@@ -208,6 +430,7 @@ class RoboEyes:
     def set_space_between(self, space: int):
         """Set space between eyes (can be negative for overlap)."""
         self.space_between = space
+        self._offset_table = None
 
     def set_cyclops(self, enabled: bool):
         """Enable/disable single eye (cyclops) mode."""
@@ -228,42 +451,29 @@ class RoboEyes:
         """Set the eye mood/expression."""
         self.mood = mood
 
-        if mood == Mood.DEFAULT:
-            self._target_left_top_mod = 0.0
-            self._target_left_bottom_mod = 0.0
-            self._target_right_top_mod = 0.0
-            self._target_right_bottom_mod = 0.0
-
-        elif mood == Mood.HAPPY:
-            # Squint from bottom (happy/smiling)
-            self._target_left_top_mod = 0.0
-            self._target_left_bottom_mod = 0.4
-            self._target_right_top_mod = 0.0
-            self._target_right_bottom_mod = 0.4
-
-        elif mood == Mood.ANGRY:
-            # Slant inward from top (angry eyebrows)
-            self._target_left_top_mod = 0.35  # inner side down
-            self._target_left_bottom_mod = 0.0
-            self._target_right_top_mod = 0.35
-            self._target_right_bottom_mod = 0.0
-
-        elif mood == Mood.TIRED:
-            # Droop from top (tired/sleepy)
-            self._target_left_top_mod = 0.5
-            self._target_left_bottom_mod = 0.0
-            self._target_right_top_mod = 0.5
-            self._target_right_bottom_mod = 0.0
+        top_mod, bottom_mod = _MOOD_MODS.get(mood, (0.0, 0.0))
+        self._target_left_top_mod = top_mod
+        self._target_left_bottom_mod = bottom_mod
+        self._target_right_top_mod = top_mod
+        self._target_right_bottom_mod = bottom_mod
 
     def set_position(self, position: Position):
         """Set where the eyes are looking."""
         self.position = position
 
-        # Calculate offsets based on position
+        # The offsets only depend on the eye layout; build them on first use
+        # after a layout change rather than on every (idle) call
+        offsets = self._offset_table
+        if offsets is None:
+            offsets = self._offset_table = self._position_offsets()
+        self._target_x_offset, self._target_y_offset = offsets.get(position, (0, 0))
+
+    def _position_offsets(self) -> dict:
+        """Target (x, y) offset of every position for the current eye layout."""
         max_x = (self.width - self.left_eye.width - self.right_eye.width - self.space_between) / 2 - 10
         max_y = (self.height - max(self.left_eye.height, self.right_eye.height)) / 2 - 10
 
-        offsets = {
+        return {
             Position.DEFAULT: (0, 0),
             Position.N: (0, -max_y * 0.7),
             Position.NE: (max_x * 0.7, -max_y * 0.7),
@@ -275,24 +485,9 @@ class RoboEyes:
             Position.NW: (-max_x * 0.7, -max_y * 0.7),
         }
 
-        self._target_x_offset, self._target_y_offset = offsets.get(position, (0, 0))
-
     def look(self, direction: str):
         """Convenience method to set position by string."""
-        position_map = {
-            "center": Position.DEFAULT,
-            "default": Position.DEFAULT,
-            "n": Position.N, "north": Position.N, "up": Position.N,
-            "ne": Position.NE, "northeast": Position.NE,
-            "e": Position.E, "east": Position.E, "right": Position.E,
-            "se": Position.SE, "southeast": Position.SE,
-            "s": Position.S, "south": Position.S, "down": Position.S,
-            "sw": Position.SW, "southwest": Position.SW,
-            "w": Position.W, "west": Position.W, "left": Position.W,
-            "nw": Position.NW, "northwest": Position.NW,
-        }
-        pos = position_map.get(direction.lower(), Position.DEFAULT)
-        self.set_position(pos)
+        self.set_position(_LOOK_DIRECTIONS.get(direction.lower(), Position.DEFAULT))
 
     # === Eye Open/Close ===
 
@@ -327,7 +522,7 @@ class RoboEyes:
     def _blink_animation(self, t: float, left: bool, right: bool):
         """Blink animation function."""
         # Blink is a quick close and open
-        blink_curve = 1.0 - math.sin(t * math.pi)  # 1 -> 0 -> 1
+        blink_curve = 1.0 - _SIN_LUT[int(t * 128) & 255]  # 1 -> 0 -> 1
 
         if left:
             self.state.left_open = blink_curve
@@ -344,7 +539,7 @@ class RoboEyes:
 
     def _confused_animation(self, t: float):
         """Confused shake animation."""
-        shake = math.sin(t * math.pi * 8) * 15 * (1 - t)  # Decaying shake
+        shake = _SIN_LUT[int(t * 1024) & 255] * 15 * (1 - t)  # Decaying shake
         self.state.x_offset = self._target_x_offset + shake
         return t >= 1.0
 
@@ -354,7 +549,7 @@ class RoboEyes:
 
     def _laugh_animation(self, t: float):
         """Laugh shake animation."""
-        shake = math.sin(t * math.pi * 10) * 8 * (1 - t)
+        shake = _SIN_LUT[int(t * 1280) & 255] * 8 * (1 - t)
         self.state.y_offset = self._target_y_offset + shake
         return t >= 1.0
 
@@ -362,7 +557,7 @@ class RoboEyes:
         """Start a timed animation."""
         self._animating = True
         self._animation_func = func
-        self._animation_start_time = time.time()
+        self._animation_start_time = time.monotonic()
         self._animation_duration = duration
 
     # === Auto Behaviors ===
@@ -375,10 +570,12 @@ class RoboEyes:
         if enabled:
             self._schedule_next_blink()
 
-    def _schedule_next_blink(self):
+    def _schedule_next_blink(self, now: Optional[float] = None):
         """Schedule the next automatic blink."""
+        if now is None:
+            now = time.monotonic()
         delay = self.autoblink_interval + random.uniform(-self.autoblink_variation, self.autoblink_variation)
-        self._next_blink_time = time.time() + max(0.5, delay)
+        self._next_blink_time = now + max(0.5, delay)
 
     def set_idle_mode(self, enabled: bool, interval: float = 3.0, variation: float = 2.0):
         """Enable/disable idle eye wandering."""
@@ -388,10 +585,12 @@ class RoboEyes:
         if enabled:
             self._schedule_next_idle()
 
-    def _schedule_next_idle(self):
+    def _schedule_next_idle(self, now: Optional[float] = None):
         """Schedule the next idle movement."""
+        if now is None:
+            now = time.monotonic()
         delay = self.idle_interval + random.uniform(-self.idle_variation, self.idle_variation)
-        self._next_idle_time = time.time() + max(0.5, delay)
+        self._next_idle_time = now + max(0.5, delay)
 
     # === Flicker Effects ===
 
@@ -399,11 +598,13 @@ class RoboEyes:
         """Enable horizontal flicker effect."""
         self.h_flicker = enabled
         self.h_flicker_amplitude = amplitude
+        self._h_flicker_ring = _flicker_ring(amplitude)
 
     def set_v_flicker(self, enabled: bool, amplitude: int = 2):
         """Enable vertical flicker effect."""
         self.v_flicker = enabled
         self.v_flicker_amplitude = amplitude
+        self._v_flicker_ring = _flicker_ring(amplitude)
 
     # === Sweat Drop ===
 
@@ -425,19 +626,26 @@ class RoboEyes:
 
     def _update_state(self):
         """Update animated state towards targets."""
+        # Eight scalar lerps: a NumPy state vector costs several times more
+        # per call at this size, so bind the lookups to locals instead
+        state = self.state
+        lerp = self._lerp
+        move = self.transition_speed
+        blink = self.blink_speed
+
         # Smooth position transitions
-        self.state.x_offset = self._lerp(self.state.x_offset, self._target_x_offset, self.transition_speed)
-        self.state.y_offset = self._lerp(self.state.y_offset, self._target_y_offset, self.transition_speed)
+        state.x_offset = lerp(state.x_offset, self._target_x_offset, move)
+        state.y_offset = lerp(state.y_offset, self._target_y_offset, move)
 
         # Smooth open/close (faster for blinks)
-        self.state.left_open = self._lerp(self.state.left_open, self._target_left_open, self.blink_speed)
-        self.state.right_open = self._lerp(self.state.right_open, self._target_right_open, self.blink_speed)
+        state.left_open = lerp(state.left_open, self._target_left_open, blink)
+        state.right_open = lerp(state.right_open, self._target_right_open, blink)
 
         # Smooth mood transitions
-        self.state.left_top_mod = self._lerp(self.state.left_top_mod, self._target_left_top_mod, self.transition_speed)
-        self.state.left_bottom_mod = self._lerp(self.state.left_bottom_mod, self._target_left_bottom_mod, self.transition_speed)
-        self.state.right_top_mod = self._lerp(self.state.right_top_mod, self._target_right_top_mod, self.transition_speed)
-        self.state.right_bottom_mod = self._lerp(self.state.right_bottom_mod, self._target_right_bottom_mod, self.transition_speed)
+        state.left_top_mod = lerp(state.left_top_mod, self._target_left_top_mod, move)
+        state.left_bottom_mod = lerp(state.left_bottom_mod, self._target_left_bottom_mod, move)
+        state.right_top_mod = lerp(state.right_top_mod, self._target_right_top_mod, move)
+        state.right_bottom_mod = lerp(state.right_bottom_mod, self._target_right_bottom_mod, move)
 
         # Curiosity mode: outer eye grows when looking sideways
         if self.curiosity_mode:
@@ -450,28 +658,24 @@ class RoboEyes:
                 self.state.left_height = self.left_eye.height_default
                 self.state.right_height = self.right_eye.height_default
 
-    def _process_auto_behaviors(self):
+    def _process_auto_behaviors(self, now: float):
         """Process automatic blink and idle behaviors."""
-        now = time.time()
-
         # Auto blink
         if self.autoblink_enabled and now >= self._next_blink_time and not self._animating:
             self.blink()
-            self._schedule_next_blink()
+            self._schedule_next_blink(now)
 
         # Idle mode
         if self.idle_mode and now >= self._next_idle_time and not self._animating:
-            positions = list(Position)
-            new_pos = random.choice(positions)
-            self.set_position(new_pos)
-            self._schedule_next_idle()
+            self.set_position(random.choice(_POSITIONS))
+            self._schedule_next_idle(now)
 
-    def _process_animation(self):
+    def _process_animation(self, now: float):
         """Process current animation if any."""
         if not self._animating or self._animation_func is None:
             return
 
-        elapsed = time.time() - self._animation_start_time
+        elapsed = now - self._animation_start_time
         t = min(1.0, elapsed / self._animation_duration)
 
         done = self._animation_func(t)
@@ -480,11 +684,13 @@ class RoboEyes:
             self._animating = False
             self._animation_func = None
 
-    def _draw_rounded_rect(self, draw: ImageDraw, x: float, y: float,
-                           width: float, height: float, radius: float,
-                           top_mod: float = 0.0, bottom_mod: float = 0.0,
-                           color: Tuple[int, int, int] = (255, 255, 255)):
-        """Draw a rounded rectangle with optional top/bottom modifications."""
+    def _eye_box(self, x: float, y: float, width: float, height: float, radius: float,
+                 top_mod: float = 0.0, bottom_mod: float = 0.0) -> Optional[tuple]:
+        """
+        Whole-pixel geometry of a rounded-rect eye with optional top/bottom
+        modifications: (x, y, width, height, radius, squashed), or None when
+        it is too flat to draw. Equal boxes draw identical pixels.
+        """
         # Clamp radius
         radius = min(radius, width / 2, height / 2)
 
@@ -495,61 +701,116 @@ class RoboEyes:
         # Effective height after modifications
         eff_height = height - top_offset - bottom_offset
         if eff_height < 2:
+            return None
+
+        # Round the edges, not the sizes, so each edge lands on the pixel
+        # Pillow would put it on; rounding the top and the height separately
+        # moves the bottom edge by a row whenever both round the same way
+        x0 = round(x)
+        y0 = round(y + top_offset)
+        return (x0, y0, round(x + width) - x0, round(y + top_offset + eff_height) - y0,
+                round(radius), top_mod > 0.01 or bottom_mod > 0.01)
+
+    def _draw_eye(self, canvas, box: tuple, color: Tuple[int, int, int]):
+        """Draw an eye from its _eye_box() onto an ImageDraw or frame array."""
+        x, y, width, height, radius, squashed = box
+
+        # The corner circles of squashed eyes can reach past the height
+        self._mark_dirty(x, y + min(0, height - 2 * radius), x + width, y + max(height, 2 * radius))
+
+        if njit is not None:
+            # Plain and squashed eyes in one compiled pass over the frame array
+            _raster_rounded_rect(canvas, x, y, width, height, radius, self._pixel(color))
             return
 
-        y_top = y + top_offset
-
-        # Draw using polygon for modified shapes, or simple rounded rect for normal
-        if top_mod > 0.01 or bottom_mod > 0.01:
-            # Draw as filled polygon (approximate rounded corners)
-            points = []
-
-            # Top left corner
-            points.append((x + radius, y_top))
-
-            # Top right corner
-            points.append((x + width - radius, y_top))
-
-            # Right side
-            points.append((x + width, y_top + radius))
-            points.append((x + width, y_top + eff_height - radius))
+        # Squashed (mood) shapes are a polygon, four corner circles and two
+        # rectangles; plain eyes are one rounded rect. Either is rasterized
+        # once per size into a cached mask and the eye color pasted through
+        # it, which also covers every height a blink passes through.
+        mask, y_lo = _eye_mask(width, height, radius, squashed)
+        self._img.paste(self._ink(color), (x, y + y_lo), mask)
 
-            # Bottom right
-            points.append((x + width - radius, y_top + eff_height))
-
-            # Bottom left
-            points.append((x + radius, y_top + eff_height))
-
-            # Left side
-            points.append((x, y_top + eff_height - radius))
-            points.append((x, y_top + radius))
-
-            draw.polygon(points, fill=color)
-
-            # Draw corner circles
-            r = radius
-            # Top-left
-            draw.ellipse([x, y_top, x + r * 2, y_top + r * 2], fill=color)
-            # Top-right
-            draw.ellipse([x + width - r * 2, y_top, x + width, y_top + r * 2], fill=color)
-            # Bottom-right
-            draw.ellipse([x + width - r * 2, y_top + eff_height - r * 2, x + width, y_top + eff_height], fill=color)
-            # Bottom-left
-            draw.ellipse([x, y_top + eff_height - r * 2, x + r * 2, y_top + eff_height], fill=color)
+    def _prerender_eye_masks(self):
+        """
+        Build the masks of each mood's eye shape at every blink height.
 
-            # Fill center rectangles
-            draw.rectangle([x + radius, y_top, x + width - radius, y_top + eff_height], fill=color)
-            draw.rectangle([x, y_top + radius, x + width, y_top + eff_height - radius], fill=color)
+        Together they form an atlas of the shapes the eyes settle into, so
+        the first blink in a new mood pastes instead of rasterizing. Shapes
+        in between (mood transitions) still fill the caches as they appear.
+        """
+        sizes = {
+            (self.left_eye.width, self.left_eye.height, self.left_eye.border_radius),
+            (self.right_eye.width, self.right_eye.height, self.right_eye.border_radius),
+        }
+        for width, height, radius in sizes:
+            for top_mod, bottom_mod in _MOOD_MODS.values():
+                for open_height in range(2, math.ceil(height) + 1):
+                    box = self._eye_box(0, 0, width, open_height, radius, top_mod, bottom_mod)
+                    if box is not None:
+                        _eye_mask(*box[2:])
+
+    def _clear(self, box: list):
+        """Fill the inclusive box [x0, y0, x1, y1] with the background color."""
+        if self._fb is None:
+            self._draw.rectangle(box, fill=self._ink(self.bg_color))
+            return
+        x0, y0, x1, y1 = box
+        self._fb[max(y0, 0):max(y1 + 1, 0), max(x0, 0):max(x1 + 1, 0)] = \
+            self._pixel(self.bg_color)
+
+    def _pixel(self, color: Tuple[int, int, int]) -> tuple:
+        """The bytes of one frame array pixel for an RGB color."""
+        return _rgb565_pixel(color) if self.rgb565 else tuple(color)
+
+    def _ink(self, color: Tuple[int, int, int]):
+        """The fill for the Pillow image: the color, or its index in a palette image."""
+        if self._img.mode != 'P':
+            return color
+        return (self.bg_color, self.eye_color, _SWEAT_COLOR).index(tuple(color))
+
+    def _changed_region(self, *boxes) -> Optional[Tuple[int, int, int, int]]:
+        """The union of the inclusive boxes as an exclusive (x0, y0, x1, y1) clipped to the frame."""
+        boxes = [b for b in boxes if b is not None]
+        if not boxes:
+            return None
+        x0 = max(min(b[0] for b in boxes), 0)
+        y0 = max(min(b[1] for b in boxes), 0)
+        x1 = min(max(b[2] for b in boxes) + 1, self.width)
+        y1 = min(max(b[3] for b in boxes) + 1, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def _sync_image(self, *boxes):
+        """Copy the part of the frame array covered by the boxes into the Image."""
+        region = self._changed_region(*boxes)
+        if region is not None:
+            x0, y0, x1, y1 = region
+            self._img.paste(Image.fromarray(self._fb[y0:y1, x0:x1]), (x0, y0))
+
+    def _sync_palette_frame(self, *boxes):
+        """Pack the part of the palette image covered by the boxes into the RGB565 frame."""
+        region = self._changed_region(*boxes)
+        if region is not None:
+            x0, y0, x1, y1 = region
+            table = np.array([_rgb565_pixel(c) for c in (self.bg_color, self.eye_color, _SWEAT_COLOR)],
+                             dtype=np.uint8)
+            self._frame[y0:y1, x0:x1] = table[np.asarray(self._img.crop(region))]
+
+    def _mark_dirty(self, x0: float, y0: float, x1: float, y1: float):
+        """Grow the drawn box to cover a shape, with a pixel of slack for rounding."""
+        box = [math.floor(x0) - 1, math.floor(y0) - 1, math.ceil(x1) + 1, math.ceil(y1) + 1]
+        dirty = self._dirty
+        if dirty is None:
+            self._dirty = box
         else:
-            # Simple rounded rectangle
-            draw.rounded_rectangle(
-                [x, y_top, x + width, y_top + eff_height],
-                radius=radius,
-                fill=color
-            )
+            dirty[0] = min(dirty[0], box[0])
+            dirty[1] = min(dirty[1], box[1])
+            dirty[2] = max(dirty[2], box[2])
+            dirty[3] = max(dirty[3], box[3])
 
-    def _draw_sweat_drop(self, draw: ImageDraw, x: float, y: float):
-        """Draw animated sweat drop."""
+    def _draw_sweat_drop(self, canvas, x: float, y: float):
+        """Draw animated sweat drop onto an ImageDraw or frame array."""
         if not self.sweat_enabled or not self._sweat_visible:
             return
 
@@ -559,43 +820,77 @@ class RoboEyes:
             self._sweat_y = 0
 
         drop_y = y + self._sweat_y
+        self._mark_dirty(x - 4, drop_y - 6, x + 4, drop_y + 8)
 
         # Draw teardrop shape
-        draw.ellipse([x - 4, drop_y, x + 4, drop_y + 8], fill=(100, 150, 255))
-        draw.polygon([(x, drop_y - 6), (x - 4, drop_y + 2), (x + 4, drop_y + 2)], fill=(100, 150, 255))
+        if njit is not None:
+            _raster_sweat_drop(canvas, x, drop_y, self._pixel(_SWEAT_COLOR))
+            return
+        # Drawn directly: at 9x15 px the ellipse and polygon cost no more
+        # than pasting through a cached mask, and keep sub-pixel placement
+        ink = self._ink(_SWEAT_COLOR)
+        canvas.ellipse([x - 4, drop_y, x + 4, drop_y + 8], fill=ink)
+        canvas.polygon([(x, drop_y - 6), (x - 4, drop_y + 2), (x + 4, drop_y + 2)], fill=ink)
 
-    def update(self) -> Image.Image:
+    def update(self) -> Union[Image.Image, np.ndarray]:
         """
         Update animation state and render a frame.
-        Returns a PIL Image that can be displayed.
+        Returns a PIL Image that can be displayed (an RGB565 array with
+        rgb565=True). The same frame is redrawn by the next update(), so
+        copy it if you need to keep a frame.
+
+        Sleeps until the next frame is due; loops with other work to do
+        can poll should_render() and call render() instead.
         """
-        # Frame rate limiting
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_frame_time
         if elapsed < self.frame_time:
             time.sleep(self.frame_time - elapsed)
-        self.last_frame_time = time.time()
+            now = time.monotonic()
+        return self.render(now)
+
+    def should_render(self, now: Optional[float] = None) -> bool:
+        """Whether a frame interval has passed since the last render()."""
+        if now is None:
+            now = time.monotonic()
+        return now - self.last_frame_time >= self.frame_time
+
+    def render(self, now: Optional[float] = None) -> Union[Image.Image, np.ndarray]:
+        """Update animation state and render a frame right away, like update() without the wait."""
+        # One monotonic timestamp drives the whole frame
+        if now is None:
+            now = time.monotonic()
+        self.last_frame_time = now
 
         # Process behaviors and animations
-        self._process_auto_behaviors()
-        self._process_animation()
+        self._process_auto_behaviors(now)
+        self._process_animation(now)
         self._update_state()
 
-        # Create frame
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
-        draw = ImageDraw.Draw(img)
+        fb = self._fb
+        canvas = self._draw if fb is None else fb
+        if fb is None and not self._masks_ready:
+            self._prerender_eye_masks()
+            self._masks_ready = True
 
         # Calculate eye positions
         center_x = self.width / 2
         center_y = self.height / 2
 
         # Apply flicker
-        flicker_x = random.randint(-self.h_flicker_amplitude, self.h_flicker_amplitude) if self.h_flicker else 0
-        flicker_y = random.randint(-self.v_flicker_amplitude, self.v_flicker_amplitude) if self.v_flicker else 0
+        flicker_x = flicker_y = 0
+        if self.h_flicker or self.v_flicker:
+            i = self._flicker_index = (self._flicker_index + 1) % _FLICKER_RING
+            if self.h_flicker:
+                flicker_x = self._h_flicker_ring[i]
+            if self.v_flicker:
+                flicker_y = self._v_flicker_ring[i]
 
         offset_x = self.state.x_offset + flicker_x
         offset_y = self.state.y_offset + flicker_y
 
+        # Place the eyes in whole pixels before drawing anything
+        boxes = []
         if self.cyclops_mode:
             # Single centered eye
             eye_w = self.state.left_width
@@ -605,11 +900,10 @@ class RoboEyes:
             ex = center_x - eye_w / 2 + offset_x
             ey = center_y - eye_h / 2 + offset_y
 
-            self._draw_rounded_rect(
-                draw, ex, ey, eye_w, eye_h, eye_r,
-                self.state.left_top_mod, self.state.left_bottom_mod,
-                self.eye_color
-            )
+            boxes.append(self._eye_box(
+                ex, ey, eye_w, eye_h, eye_r,
+                self.state.left_top_mod, self.state.left_bottom_mod
+            ))
         else:
             # Two eyes
             total_width = self.state.left_width + self.space_between + self.state.right_width
@@ -619,34 +913,64 @@ class RoboEyes:
             left_h = self.state.left_height * self.state.left_open
             if left_h > 1:
                 left_y = center_y - left_h / 2 + offset_y
-                self._draw_rounded_rect(
-                    draw, start_x, left_y,
+                boxes.append(self._eye_box(
+                    start_x, left_y,
                     self.state.left_width, left_h, self.state.left_radius,
-                    self.state.left_top_mod, self.state.left_bottom_mod,
-                    self.eye_color
-                )
+                    self.state.left_top_mod, self.state.left_bottom_mod
+                ))
 
             # Right eye
             right_x = start_x + self.state.left_width + self.space_between
             right_h = self.state.right_height * self.state.right_open
             if right_h > 1:
                 right_y = center_y - right_h / 2 + offset_y
-                self._draw_rounded_rect(
-                    draw, right_x, right_y,
+                boxes.append(self._eye_box(
+                    right_x, right_y,
                     self.state.right_width, right_h, self.state.right_radius,
-                    self.state.right_top_mod, self.state.right_bottom_mod,
-                    self.eye_color
-                )
-
-            # Sweat drop (top right of right eye)
-            if self.sweat_enabled:
-                sweat_x = right_x + self.state.right_width + 10
-                sweat_y = center_y - self.state.right_height / 2 - 20 + offset_y
-                self._draw_sweat_drop(draw, sweat_x, sweat_y)
-
-        return img
-
-    def get_frame(self) -> Image.Image:
+                    self.state.right_top_mod, self.state.right_bottom_mod
+                ))
+        boxes = tuple(box for box in boxes if box is not None)
+
+        # Skip the redraw when the eyes land on the same pixels as last
+        # frame: eyes at rest, lerps settling by sub-pixel steps, flicker
+        # landing on the same offset, or every eye too flat to draw (the
+        # bottom of a blink). The sweat drop moves every frame.
+        draw_sweat = self.sweat_enabled and not self.cyclops_mode
+        if draw_sweat:
+            frame_state = None
+        else:
+            frame_state = (boxes, self.bg_color, self.eye_color)
+            if frame_state == self._last_frame_state:
+                return self._frame
+        self._last_frame_state = frame_state
+
+        # Clear only what the last frame drew; the rest is still background
+        # unless the background color changed
+        cleared = self._dirty
+        if self.bg_color != self._cleared_bg:
+            cleared = [0, 0, self.width, self.height]
+            self._cleared_bg = self.bg_color
+        if cleared is not None:
+            self._clear(cleared)
+        self._dirty = None
+
+        for box in boxes:
+            self._draw_eye(canvas, box, self.eye_color)
+
+        # Sweat drop (top right of right eye)
+        if draw_sweat:
+            sweat_x = right_x + self.state.right_width + 10
+            sweat_y = center_y - self.state.right_height / 2 - 20 + offset_y
+            self._draw_sweat_drop(canvas, sweat_x, sweat_y)
+
+        if fb is None:
+            if self.rgb565:
+                self._sync_palette_frame(cleared, self._dirty)
+        elif not self.rgb565:
+            self._sync_image(cleared, self._dirty)
+        return self._frame
+
+    def get_frame(self) -> Union[Image.Image, np.ndarray]:
         """Alias for update() - returns current frame."""
         return self.update()
 
@@ -680,6 +1004,7 @@ class ST7789Display:
 
         self.width = width
         self.height = height
+        self.rotation = rotation
 
         # Initialize display
         self.display = st7789.ST7789(
@@ -694,9 +1019,48 @@ class ST7789Display:
             spi_speed_hz=60000000
         )
 
-    def show(self, image: Image.Image):
-        """Display a PIL Image on the screen."""
-        self.display.display(image)
+        # spidev >= 3.5 sends any buffer (in kernel-sized chunks) without
+        # copying it into a list; older versions go through data()
+        self._writebytes2 = getattr(getattr(self.display, '_spi', None), 'writebytes2', None)
+
+        # Panel-order RGB565 pixels, reused by every show() that has to
+        # rotate or pack
+        self._panel_buf: Optional[np.ndarray] = None
+
+    def _panel_buffer(self, shape: tuple) -> np.ndarray:
+        """The reusable panel buffer, (re)allocated for an HxWx2 shape."""
+        if self._panel_buf is None or self._panel_buf.shape != shape:
+            self._panel_buf = np.empty(shape, dtype=np.uint8)
+        return self._panel_buf
+
+    def show(self, image: Union[Image.Image, np.ndarray]):
+        """Display a PIL Image, or an HxWx2 RGB565 array from RoboEyes(rgb565=True)."""
+        # Pack to RGB565 with a few NumPy ufuncs into the panel buffer and
+        # send it as one buffer, rather than display(), which turns every
+        # byte into a Python int in a list before the SPI write. Rotation
+        # matches display(). RGB565 arrays are already panel pixels: they
+        # are only rotated, and sent as they are when no rotation is needed.
+        k = self.rotation // 90
+        if isinstance(image, np.ndarray):
+            if k % 4 == 0 and image.flags.c_contiguous:
+                pixels = image
+            else:
+                rotated = np.rot90(image, k)
+                pixels = self._panel_buffer(rotated.shape)
+                np.copyto(pixels, rotated)
+        else:
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            rgb = np.rot90(np.asarray(image), k)
+            pixels = self._panel_buffer(rgb.shape[:2] + (2,))
+            _pack_rgb565(rgb, pixels)
+
+        self.display.set_window()
+        if self._writebytes2 is not None:
+            self.display.data([])  # data/command pin to data
+            self._writebytes2(memoryview(pixels).cast('B'))
+        else:
+            self.display.data(pixels.tobytes())
 
 
 class LumaDisplay:
@@ -5,10 +5,15 @@ A Python port of the FluxGarage RoboEyes Arduino library.
 https://github.com/FluxGarage/RoboEyes
 
 Designed for ST7789 displays (like Waveshare 2" LCD) on Raspberry Pi.
+
+Frame buffer contract: RoboEyes.update_into(out) takes a caller-owned
+(height, width, 3) uint8 array, reused across frames, and copies each
+rendered frame into it; it returns whether the frame changed. Rendering
+itself always happens in RoboEyes' internal buffer.
 """
 
 from .eyes import RoboEyes, Mood, Position
-from .display import WaveshareDisplay, MockDisplay
+from .display import WaveshareDisplay, MockDisplay, pack_rgb565
 
 __version__ = "1.0.0"
-__all__ = ["RoboEyes", "Mood", "Position", "WaveshareDisplay", "MockDisplay"]
+__all__ = ["RoboEyes", "Mood", "Position", "WaveshareDisplay", "MockDisplay", "pack_rgb565"]
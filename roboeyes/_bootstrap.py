@@ -0,0 +1,21 @@
+"""
+Shared imports for the demo and example scripts.
+
+Both scripts import everything from here, so the package import and the
+Waveshare library location are resolved in one place:
+
+    from roboeyes._bootstrap import RoboEyes, Mood, WaveshareDisplay, LCD_LIB_PATH
+
+Set ROBOEYES_LCD_LIB to the LCD_Module_RPI_code python folder if it is not
+in one of the locations WaveshareDisplay already checks.
+"""
+
+import os
+
+from .eyes import RoboEyes, Mood, Position
+from .display import WaveshareDisplay, MockDisplay
+
+# Waveshare library location from the environment (None: auto-detect)
+LCD_LIB_PATH = os.environ.get('ROBOEYES_LCD_LIB') or None
+
+__all__ = ["RoboEyes", "Mood", "Position", "WaveshareDisplay", "MockDisplay", "LCD_LIB_PATH"]
@@ -9,16 +9,113 @@ Or run directly:
     python3 demo.py
 """
 
+import os
 import sys
 import time
 import argparse
 
-# Handle running as module or directly
-try:
-    from roboeyes import RoboEyes, Mood, Position, WaveshareDisplay, MockDisplay
-except ImportError:
-    from eyes import RoboEyes, Mood, Position
-    from display import WaveshareDisplay, MockDisplay
+# Run directly (python3 demo.py): make the roboeyes package importable
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from roboeyes._bootstrap import (
+    RoboEyes, Mood, Position, WaveshareDisplay, MockDisplay, LCD_LIB_PATH
+)
+
+
+# Length of each demo phase
+PHASE_NS = 5_000_000_000
+
+
+# ========== Demo Phases ==========
+# Each function sets the eyes up for one phase of the demo sequence.
+
+def _phase_default(eyes: RoboEyes):
+    eyes.set_mood(Mood.DEFAULT)
+    eyes.set_idle_mode(True, interval=1.5, variation=0.5)
+    eyes.set_sweat(False)
+    eyes.set_cyclops(False)
+
+
+def _phase_happy(eyes: RoboEyes):
+    eyes.set_mood(Mood.HAPPY)
+    eyes.set_idle_mode(False)
+    eyes.set_position(Position.DEFAULT)
+
+
+def _phase_angry(eyes: RoboEyes):
+    eyes.set_mood(Mood.ANGRY)
+    eyes.set_position(Position.DEFAULT)
+
+
+def _phase_tired(eyes: RoboEyes):
+    eyes.set_mood(Mood.TIRED)
+    eyes.set_position(Position.S)
+
+
+def _phase_look_around(eyes: RoboEyes):
+    # Positions are stepped through LOOK_AROUND in the main loop
+    eyes.set_mood(Mood.DEFAULT)
+
+
+def _phase_confused(eyes: RoboEyes):
+    eyes.anim_confused(duration=0.8)
+
+
+def _phase_laugh(eyes: RoboEyes):
+    eyes.anim_laugh(duration=0.8)
+
+
+def _phase_wink_left(eyes: RoboEyes):
+    eyes.wink_left()
+
+
+def _phase_wink_right(eyes: RoboEyes):
+    eyes.wink_right()
+
+
+def _phase_curious(eyes: RoboEyes):
+    eyes.set_curiosity(True)
+    eyes.set_idle_mode(True, interval=1.0, variation=0.5)
+
+
+def _phase_sweat(eyes: RoboEyes):
+    eyes.set_curiosity(False)
+    eyes.set_idle_mode(False)
+    eyes.set_sweat(True)
+    eyes.set_mood(Mood.DEFAULT)
+    eyes.set_position(Position.DEFAULT)
+
+
+def _phase_cyclops(eyes: RoboEyes):
+    eyes.set_sweat(False)
+    eyes.set_cyclops(True)
+    eyes.set_mood(Mood.DEFAULT)
+
+
+# (label, setup function) for each phase, in order
+PHASES = (
+    ("Default mood, looking around (idle mode)", _phase_default),
+    ("Happy mood!", _phase_happy),
+    ("Angry mood!", _phase_angry),
+    ("Tired mood...", _phase_tired),
+    ("Looking around (compass directions)", _phase_look_around),
+    ("Confused animation!", _phase_confused),
+    ("Laugh animation!", _phase_laugh),
+    ("Winking left...", _phase_wink_left),
+    ("Winking right...", _phase_wink_right),
+    ("Curiosity mode ON", _phase_curious),
+    ("Sweating nervously...", _phase_sweat),
+    ("Cyclops mode!", _phase_cyclops),
+)
+
+# Phase whose positions are stepped through LOOK_AROUND (two per second)
+LOOK_AROUND_PHASE = 4
+LOOK_AROUND = (
+    Position.N, Position.NE, Position.E, Position.SE,
+    Position.S, Position.SW, Position.W, Position.NW,
+    Position.DEFAULT
+)
 
 
 def run_demo(display_type: str = "waveshare", lib_path: str = None):
@@ -48,7 +145,7 @@ def run_demo(display_type: str = "waveshare", lib_path: str = None):
                 height=240,
                 rotation=90,
                 backlight=50,
-                lib_path=lib_path
+                lib_path=lib_path or LCD_LIB_PATH
             )
         except ImportError as e:
             print(f"Warning: {e}")
@@ -66,107 +163,52 @@ def run_demo(display_type: str = "waveshare", lib_path: str = None):
     eyes.set_autoblinker(True, interval=3.0, variation=1.5)
 
     try:
-        start_time = time.time()
+        # Bind per-frame lookups to locals
+        update = eyes.update_ndarray
+        show = display.show
+        wait_for_frame = eyes.wait_for_frame
+        monotonic_ns = time.monotonic_ns
+
+        # Integer nanosecond timestamps; floats only for the FPS printout
+        start_ns = monotonic_ns()
         frame_count = 0
-        last_fps_time = start_time
+        last_fps_ns = start_ns
         demo_phase = 0
-        phase_start = start_time
+        phase_start_ns = start_ns
+        next_phase_ns = start_ns + PHASE_NS
 
         while True:
+            # Hold frame_rate: the tweens step per frame, and the threaded
+            # display doesn't block, so nothing else limits the loop
+            wait_for_frame()
+
             # Update and display
-            frame = eyes.update()
-            display.show(frame)
+            show(update())
             frame_count += 1
 
             # Calculate FPS every second
-            now = time.time()
-            if now - last_fps_time >= 1.0:
-                fps = frame_count / (now - last_fps_time)
-                elapsed = now - start_time
+            now_ns = monotonic_ns()
+            if now_ns - last_fps_ns >= 1_000_000_000:
+                fps = frame_count * 1e9 / (now_ns - last_fps_ns)
+                elapsed = (now_ns - start_ns) / 1e9
                 print(f"[{elapsed:6.1f}s] FPS: {fps:5.1f} | Phase: {demo_phase}")
                 frame_count = 0
-                last_fps_time = now
+                last_fps_ns = now_ns
 
             # Demo sequence - change phase every 5 seconds
-            phase_elapsed = now - phase_start
-            if phase_elapsed >= 5.0:
-                demo_phase = (demo_phase + 1) % 12
-                phase_start = now
-
-                if demo_phase == 0:
-                    print("  -> Default mood, looking around (idle mode)")
-                    eyes.set_mood(Mood.DEFAULT)
-                    eyes.set_idle_mode(True, interval=1.5, variation=0.5)
-                    eyes.set_sweat(False)
-
-                elif demo_phase == 1:
-                    print("  -> Happy mood!")
-                    eyes.set_mood(Mood.HAPPY)
-                    eyes.set_idle_mode(False)
-                    eyes.set_position(Position.DEFAULT)
-
-                elif demo_phase == 2:
-                    print("  -> Angry mood!")
-                    eyes.set_mood(Mood.ANGRY)
-                    eyes.set_position(Position.DEFAULT)
-
-                elif demo_phase == 3:
-                    print("  -> Tired mood...")
-                    eyes.set_mood(Mood.TIRED)
-                    eyes.set_position(Position.S)
-
-                elif demo_phase == 4:
-                    print("  -> Looking around (compass directions)")
-                    eyes.set_mood(Mood.DEFAULT)
-
-                elif demo_phase == 5:
-                    print("  -> Confused animation!")
-                    eyes.anim_confused(duration=0.8)
-
-                elif demo_phase == 6:
-                    print("  -> Laugh animation!")
-                    eyes.anim_laugh(duration=0.8)
-
-                elif demo_phase == 7:
-                    print("  -> Winking left...")
-                    eyes.wink_left()
-
-                elif demo_phase == 8:
-                    print("  -> Winking right...")
-                    eyes.wink_right()
-
-                elif demo_phase == 9:
-                    print("  -> Curiosity mode ON")
-                    eyes.set_curiosity(True)
-                    eyes.set_idle_mode(True, interval=1.0, variation=0.5)
-
-                elif demo_phase == 10:
-                    print("  -> Sweating nervously...")
-                    eyes.set_curiosity(False)
-                    eyes.set_idle_mode(False)
-                    eyes.set_sweat(True)
-                    eyes.set_mood(Mood.DEFAULT)
-                    eyes.set_position(Position.DEFAULT)
-
-                elif demo_phase == 11:
-                    print("  -> Cyclops mode!")
-                    eyes.set_sweat(False)
-                    eyes.set_cyclops(True)
-                    eyes.set_mood(Mood.DEFAULT)
-
-                # Reset cyclops at end
-                if demo_phase == 0:
-                    eyes.set_cyclops(False)
-
-            # Cycle through positions during phase 4
-            if demo_phase == 4:
-                sub_phase = int((phase_elapsed * 2) % 9)
-                positions = [
-                    Position.N, Position.NE, Position.E, Position.SE,
-                    Position.S, Position.SW, Position.W, Position.NW,
-                    Position.DEFAULT
-                ]
-                eyes.set_position(positions[sub_phase])
+            if now_ns >= next_phase_ns:
+                demo_phase = (demo_phase + 1) % len(PHASES)
+                phase_start_ns = now_ns
+                next_phase_ns = now_ns + PHASE_NS
+
+                label, enter_phase = PHASES[demo_phase]
+                print(f"  -> {label}")
+                enter_phase(eyes)
+
+            # Cycle through positions during the look-around phase
+            if demo_phase == LOOK_AROUND_PHASE:
+                sub_phase = ((now_ns - phase_start_ns) // 500_000_000) % 9
+                eyes.set_position(LOOK_AROUND[sub_phase])
 
     except KeyboardInterrupt:
         print()
@@ -185,7 +227,7 @@ def main():
     )
     parser.add_argument(
         "--lib-path", "-l",
-        help="Path to Waveshare LCD library"
+        help="Path to Waveshare LCD library (default: $ROBOEYES_LCD_LIB)"
     )
     args = parser.parse_args()
 
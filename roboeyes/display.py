@@ -3,9 +3,157 @@ Display drivers for RoboEyes.
 Supports Waveshare LCD modules and mock display for testing.
 """
 
-from typing import Optional
+import functools
+import importlib.util
+import os
+import sys
+import threading
+import weakref
+import zlib
+from typing import Optional, Union
+import numpy as np
 from PIL import Image
 
+try:
+    from numba import njit, prange, types
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    # Explicit signature: compiled once at import and cached on disk, so there
+    # is no JIT pause on the first frame. 'A' layout + readonly accepts both
+    # np.asarray(PIL image) and strided views of it. LLVM vectorizes the
+    # per-pixel shifts and masks for the host's SIMD unit (NEON on a 64-bit
+    # Pi), so there is no hand-written C extension for this.
+    @njit(
+        types.void(types.Array(types.uint8, 3, 'A', readonly=True), types.uint8[::1]),
+        parallel=True, cache=True, boundscheck=False
+    )
+    def _pack_rgb565(rgb, out):
+        """Pack an HxWx3 RGB888 array into big-endian RGB565 bytes in out."""
+        h, w = rgb.shape[0], rgb.shape[1]
+        for y in prange(h):
+            for x in range(w):
+                r = rgb[y, x, 0]
+                g = rgb[y, x, 1]
+                b = rgb[y, x, 2]
+                v = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+                i = 2 * (y * w + x)
+                out[i] = v >> 8
+                out[i + 1] = v & 0xFF
+else:
+    # Pillow has no RGB -> RGB565 raw packer (the BGR;16 modes are gone in
+    # Pillow 12), so without Numba the packing is done with NumPy ufuncs.
+    def _pack_rgb565(rgb, out):
+        """Pack an HxWx3 RGB888 array into big-endian RGB565 bytes in out."""
+        rgb = rgb.astype(np.uint16)
+        px = ((rgb[..., 0] & 0xF8) << 8) | ((rgb[..., 1] & 0xFC) << 3) | (rgb[..., 2] >> 3)
+        out.view('>u2')[:] = px.ravel()
+
+
+def pack_rgb565(rgb: np.ndarray, out: np.ndarray):
+    """
+    Pack RGB888 pixels into big-endian RGB565 bytes, as the ST7789 takes them.
+
+    Args:
+        rgb: HxWx3 uint8 array. Any strides, so views such as np.rot90()
+            of a frame are packed without a copy.
+        out: C-contiguous uint8 array of exactly H*W*2 bytes, written
+            row by row
+
+    Raises:
+        ValueError: If either array doesn't match that contract. The packing
+            kernel itself doesn't bounds-check, so this is what keeps a
+            mismatched frame from writing past out.
+    """
+    if rgb.ndim != 3 or rgb.shape[2] != 3 or rgb.dtype != np.uint8:
+        raise ValueError(f"expected an HxWx3 uint8 array, got {rgb.shape} {rgb.dtype}")
+    if out.dtype != np.uint8 or out.ndim != 1 or not out.flags.c_contiguous:
+        raise ValueError("out must be a contiguous 1-D uint8 array")
+    if out.size != rgb.shape[0] * rgb.shape[1] * 2:
+        raise ValueError(
+            f"out holds {out.size} bytes, {rgb.shape[0]}x{rgb.shape[1]} pixels need "
+            f"{rgb.shape[0] * rgb.shape[1] * 2}"
+        )
+    _pack_rgb565(rgb, out)
+
+
+# ST7789 MADCTL (0x36) value for each rotation: MY=0x80, MX=0x40, MV=0x20
+_MADCTL = {0: 0x00, 90: 0x60, 180: 0xC0, 270: 0xA0}
+
+
+# Common install locations of LCD_Module_RPI_code's python folder
+_LCD_LIB_PATHS = (
+    '/home/sam-pi/LCD_Module_RPI_code/RaspberryPi/python',
+    '/home/pi/LCD_Module_RPI_code/RaspberryPi/python',
+    '/opt/waveshare/LCD_Module_RPI_code/RaspberryPi/python',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_lcd_module(lib_path: Optional[str] = None):
+    """
+    Import the Waveshare LCD_2inch module.
+
+    Uses whatever `lib` package is already importable, otherwise adds the
+    first of lib_path and the common install locations that actually
+    contains lib/LCD_2inch.py to sys.path. Cached, so the search runs once.
+    """
+    try:
+        found = importlib.util.find_spec('lib.LCD_2inch') is not None
+    except ImportError:
+        found = False
+
+    if not found:
+        for path in (lib_path,) + _LCD_LIB_PATHS:
+            if path and os.path.isfile(os.path.join(path, 'lib', 'LCD_2inch.py')):
+                if path not in sys.path:
+                    sys.path.insert(0, path)
+                break
+        else:
+            raise ImportError(
+                "Waveshare LCD library not found. Make sure LCD_Module_RPI_code "
+                "is installed. You can specify the path with lib_path parameter.\n"
+                "Example: WaveshareDisplay(lib_path='/path/to/LCD_Module_RPI_code/RaspberryPi/python')"
+            )
+
+    return importlib.import_module('lib.LCD_2inch')
+
+
+def _release(lcd, cond: threading.Condition):
+    """Wake the writer thread so it can exit, and release the LCD's GPIO."""
+    with cond:
+        cond.notify()
+    try:
+        lcd.module_exit()
+    except Exception:
+        pass
+
+
+def _writer_loop(display_ref, cond: threading.Condition):
+    """
+    Background thread: send the newest pending frame.
+
+    Holds the display only through a weak reference, and strongly only
+    while checking for or sending a frame, so a display nobody references
+    is still collected (its finalizer then wakes this thread to exit).
+    """
+    while True:
+        with cond:
+            while True:
+                display = display_ref()
+                if display is None or display._closed:
+                    return
+                if display._pending_ready:
+                    break
+                del display
+                cond.wait()
+            display._front, display._pending = display._pending, display._front
+            display._pending_ready = False
+        display._send(display._front)
+        del display
+
 
 class WaveshareDisplay:
     """
@@ -13,6 +161,18 @@ class WaveshareDisplay:
 
     Requires the Waveshare LCD_Module_RPI_code library to be installed.
 
+    Pixel data goes out with one spidev writebytes2() call per frame, which
+    the kernel splits at spidev's bufsiz (4096 bytes by default). Raising it
+    cuts the number of transfers per frame, e.g. add spidev.bufsiz=65536 to
+    /boot/firmware/cmdline.txt (/boot/cmdline.txt on older images).
+
+    Call cleanup() when done (or use the display as a context manager).
+    A display that is simply dropped is still cleaned up when it is garbage
+    collected or the interpreter exits.
+
+    At the default 40 MHz SPI clock a full 320x240 frame caps out around
+    32 fps; many Pis drive the ST7789 reliably at spi_hz=62_500_000 (~50 fps).
+
     Usage:
         display = WaveshareDisplay()
         display.show(pil_image)
@@ -27,7 +187,9 @@ class WaveshareDisplay:
         rst: int = 27,
         dc: int = 25,
         bl: int = 18,
-        lib_path: Optional[str] = None
+        lib_path: Optional[str] = None,
+        threaded: bool = True,
+        spi_hz: int = 40_000_000
     ):
         """
         Initialize Waveshare display.
@@ -41,81 +203,231 @@ class WaveshareDisplay:
             dc: GPIO pin for data/command
             bl: GPIO pin for backlight
             lib_path: Path to Waveshare library (auto-detected if None)
+            threaded: Send frames from a background thread so show() returns
+                without waiting for the SPI transfer
+            spi_hz: SPI clock in Hz
         """
+        # Checked before any other state exists
+        if rotation not in _MADCTL:
+            raise ValueError(f"rotation must be one of {sorted(_MADCTL)}, got {rotation}")
+
         self.width = width
         self.height = height
         self.rotation = rotation
 
-        # Try to import Waveshare library
-        LCD_2inch = self._import_waveshare_lib(lib_path)
-
-        # Initialize display
-        self.lcd = LCD_2inch.LCD_2inch(rst=rst, dc=dc, bl=bl)
+        # The physical LCD is 240x320 portrait. Rotation is done by the
+        # controller (MADCTL), so frames are sent in their own orientation
+        # and the panel's address window is portrait or landscape to match.
+        if rotation in (0, 180):
+            self._panel_w, self._panel_h = 240, 320
+        else:
+            self._panel_w, self._panel_h = 320, 240
+
+        # Frame handoff to the writer thread (set up before anything that can
+        # fail, so cleanup() always has something to work with)
+        self._spi_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._pending_ready = False
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+
+        # Import Waveshare library (resolved once per process)
+        LCD_2inch = _find_lcd_module(lib_path)
+
+        # Initialize display. The finalizer stops the writer thread and
+        # releases the GPIO on cleanup(), garbage collection or interpreter
+        # exit, whichever comes first, and only once
+        self.lcd = LCD_2inch.LCD_2inch(spi_freq=spi_hz, rst=rst, dc=dc, bl=bl)
+        self._finalizer = weakref.finalize(self, _release, self.lcd, self._cond)
         self.lcd.Init()
-        self.lcd.clear()
+        self.lcd.command(0x36)
+        self.lcd.data(_MADCTL[rotation])
         self.lcd.bl_DutyCycle(backlight)
 
-    def _import_waveshare_lib(self, lib_path: Optional[str]):
-        """Import the Waveshare LCD library."""
-        import sys
-
-        # Try direct import first
-        try:
-            from lib import LCD_2inch
-            return LCD_2inch
-        except ImportError:
-            pass
-
-        # Common paths to try
-        paths_to_try = [
-            lib_path,
-            '/home/sam-pi/LCD_Module_RPI_code/RaspberryPi/python',
-            '/home/pi/LCD_Module_RPI_code/RaspberryPi/python',
-            '/opt/waveshare/LCD_Module_RPI_code/RaspberryPi/python',
-        ]
-
-        for path in paths_to_try:
-            if path is None:
-                continue
-            try:
-                if path not in sys.path:
-                    sys.path.insert(0, path)
-                from lib import LCD_2inch
-                return LCD_2inch
-            except ImportError:
-                continue
-
-        raise ImportError(
-            "Waveshare LCD library not found. Make sure LCD_Module_RPI_code "
-            "is installed. You can specify the path with lib_path parameter.\n"
-            "Example: WaveshareDisplay(lib_path='/path/to/LCD_Module_RPI_code/RaspberryPi/python')"
-        )
+        # Bulk pixel writes take any buffer and leave chunking to the kernel
+        self._spi_write = getattr(self.lcd.SPI, 'writebytes2', self._spi_write_chunked)
+
+        # RGB565 frame buffers for the full physical frame, reused every show().
+        # show() packs into _back; the writer thread sends _front. _pending
+        # holds the newest unsent frame, so a slow transfer drops stale frames
+        # instead of stalling the renderer.
+        self._back = np.empty(240 * 320 * 2, dtype=np.uint8)
+        self._pending = np.empty_like(self._back)
+        self._front = np.empty_like(self._back)
+
+        # Last frame sent to the panel, for dirty-rectangle updates (invalid
+        # until the first full frame has been sent), plus scratch space for
+        # the diff mask and the changed region so _send() allocates nothing
+        self._prev = np.empty((self._panel_h, self._panel_w), dtype='>u2')
+        self._prev_valid = False
+        self._last_hash: Optional[int] = None
+        self._changed = np.empty((self._panel_h, self._panel_w), dtype=bool)
+        self._tx = np.empty(240 * 320, dtype='>u2')
+
+        # Address window last programmed into the controller (sticky: the
+        # column/row commands are only re-sent when the window changes)
+        self._window = None
+
+        self.clear()
+
+        if threaded:
+            # Not a bound method: the thread must not keep the display alive
+            self._writer = threading.Thread(
+                target=_writer_loop, args=(weakref.ref(self), self._cond), daemon=True
+            )
+            self._writer.start()
+
+    def show(self, image: Union[Image.Image, np.ndarray]):
+        """
+        Display a frame on the screen.
+
+        Args:
+            image: PIL Image or HxWx3 uint8 RGB array, width x height. No
+                rotation is needed; the controller handles it. Images of
+                another size are resized; arrays must match.
+        """
+        rgb = np.asarray(image, dtype=np.uint8)
+
+        # The packer writes width x height pixels without bounds checks, so
+        # the frame's shape is checked here, once per call
+        if rgb.shape != (self._panel_h, self._panel_w, 3):
+            if not isinstance(image, Image.Image):
+                raise ValueError(
+                    f"expected a {self._panel_h}x{self._panel_w}x3 array, got {rgb.shape}"
+                )
+            image = image.convert('RGB').resize(
+                (self._panel_w, self._panel_h), Image.Resampling.LANCZOS
+            )
+            rgb = np.asarray(image)
+
+        # Pack to RGB565 ourselves and push it in one SPI write, rather than
+        # letting ShowImage build a Python list and send it in 4 KB pieces
+        _pack_rgb565(rgb, self._back)
+        self._submit()
+
+    def show_rgb565(self, data):
+        """
+        Display a frame that is already packed.
 
-    def show(self, image: Image.Image):
-        """Display a PIL Image on the screen."""
-        # The physical LCD is always 240x320 (portrait)
-        # For landscape mode (320x240), we rotate the image
+        Args:
+            data: Big-endian RGB565 bytes for the whole frame, in the same
+                orientation show() takes (e.g. RoboEyes.update_rgb565())
+        """
+        self._back[:] = np.frombuffer(data, dtype=np.uint8)
+        self._submit()
 
-        # Apply rotation to convert to physical LCD orientation
-        if self.rotation == 90:
-            # Landscape: rotate 90° CCW (or 270° CW)
-            image = image.transpose(Image.Transpose.ROTATE_270)
-        elif self.rotation == 180:
-            image = image.transpose(Image.Transpose.ROTATE_180)
-        elif self.rotation == 270:
-            # Landscape flipped: rotate 90° CW
-            image = image.transpose(Image.Transpose.ROTATE_90)
+    def write_window(self, box, buf):
+        """
+        Send one region of a packed frame straight to the panel.
 
-        # Ensure correct size for physical display (240x320)
-        if image.size != (240, 320):
-            image = image.resize((240, 320), Image.Resampling.LANCZOS)
+        For callers that track changed regions themselves, such as
+        RoboEyes.stream(). The transfer happens in the calling thread.
 
-        # Send to display
-        self.lcd.ShowImage(image)
+        Args:
+            box: (x0, y0, x1, y1) region to send, with exclusive ends
+            buf: Big-endian RGB565 bytes for the whole frame, in the same
+                orientation show() takes
+        """
+        x0, y0, x1, y1 = box
+        frame = np.frombuffer(buf, dtype='>u2').reshape(self._panel_h, self._panel_w)
+        region = frame[y0:y1, x0:x1]
+
+        with self._spi_lock:
+            tx = self._tx[:region.size].reshape(region.shape)
+            np.copyto(tx, region)
+            self._write_window(x0, y0, x1, y1, tx)
+            self._prev[y0:y1, x0:x1] = region
+        self._last_hash = None
+
+    def _submit(self):
+        """Send the frame packed in _back, or hand it to the writer thread."""
+        back = self._back
+
+        # Identical frames (eyes at rest between blinks) skip the SPI path
+        # entirely; a CRC of the packed frame is far cheaper than sending it
+        frame_hash = zlib.crc32(back)
+        if frame_hash == self._last_hash:
+            return
+        self._last_hash = frame_hash
+
+        if self._writer is None:
+            self._send(back)
+            return
+
+        # Hand the frame to the writer thread, replacing any unsent one
+        with self._cond:
+            self._back, self._pending = self._pending, back
+            self._pending_ready = True
+            self._cond.notify()
+
+    def _send(self, buf: np.ndarray):
+        """Send a packed frame, limited to the region that changed."""
+        frame = buf.view('>u2').reshape(self._panel_h, self._panel_w)
+
+        with self._spi_lock:
+            if not self._prev_valid:
+                self._write_window(0, 0, self._panel_w, self._panel_h, buf)
+                np.copyto(self._prev, frame)
+                self._prev_valid = True
+                return
+
+            # Only send the bounding box of pixels that changed since last frame
+            changed = np.not_equal(frame, self._prev, out=self._changed)
+            rows = np.flatnonzero(changed.any(axis=1))
+            if rows.size == 0:
+                return
+            y0, y1 = int(rows[0]), int(rows[-1]) + 1
+            cols = np.flatnonzero(changed[y0:y1].any(axis=0))
+            x0, x1 = int(cols[0]), int(cols[-1]) + 1
+
+            region = frame[y0:y1, x0:x1]
+            tx = self._tx[:region.size].reshape(region.shape)
+            np.copyto(tx, region)
+            self._write_window(x0, y0, x1, y1, tx)
+            self._prev[y0:y1, x0:x1] = region
+
+    def _write_window(self, x0: int, y0: int, x1: int, y1: int, buf):
+        """Send packed RGB565 pixels for the window [x0, x1) x [y0, y1)."""
+        # Same sequence as lcd.SetWindows(), but with each command's
+        # parameters in one transfer: 6 DC toggles and SPI writes per window
+        # instead of 11, and DC is left high for the pixel data. When the
+        # window is unchanged (full frames, a repeated dirty box) only the
+        # memory write command is needed to restart at its top-left corner.
+        lcd = self.lcd
+        dc = lcd.DC_PIN
+        write = lcd.SPI.writebytes
+        window = (x0, y0, x1, y1)
+        if window != self._window:
+            self._window = window
+            x1 -= 1
+            y1 -= 1
+            lcd.digital_write(dc, False)
+            write([0x2A])
+            lcd.digital_write(dc, True)
+            write([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])
+            lcd.digital_write(dc, False)
+            write([0x2B])
+            lcd.digital_write(dc, True)
+            write([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])
+        lcd.digital_write(dc, False)
+        write([0x2C])
+        lcd.digital_write(dc, True)
+        self._spi_write(buf)
+
+    def _spi_write_chunked(self, buf):
+        """Fallback for spidev < 3.3, which has no writebytes2()."""
+        data = memoryview(buf).cast('B')
+        for i in range(0, len(data), 4096):
+            self.lcd.SPI.writebytes(data[i:i + 4096].tolist())
 
     def clear(self):
         """Clear the display to black."""
-        self.lcd.clear()
+        # Not lcd.clear(): it assumes a portrait window and fills white
+        with self._spi_lock:
+            self._prev.fill(0)
+            self._write_window(0, 0, self._panel_w, self._panel_h, self._prev)
+            self._prev_valid = True
+        self._last_hash = None
 
     def set_backlight(self, value: int):
         """
@@ -127,14 +439,21 @@ class WaveshareDisplay:
         self.lcd.bl_DutyCycle(max(0, min(100, value)))
 
     def cleanup(self):
-        """Clean up GPIO resources on exit."""
-        try:
-            self.lcd.module_exit()
-        except Exception:
-            pass
-
-    def __del__(self):
-        """Cleanup on object destruction."""
+        """Stop the writer thread and clean up GPIO resources on exit."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self._finalizer()
+
+    def __enter__(self):
+        """Use the display in a with block; cleanup() runs when it exits."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Clean up on leaving the with block."""
         self.cleanup()
 
 
@@ -146,22 +465,25 @@ class MockDisplay:
     Useful for development and testing on non-Pi systems.
     """
 
-    def __init__(self, width: int = 240, height: int = 320):
+    def __init__(self, width: int = 240, height: int = 320, copy_on_store: bool = False):
         """
         Initialize mock display.
 
         Args:
             width: Display width in pixels
             height: Display height in pixels
+            copy_on_store: Copy each frame in show(). Only needed if the caller
+                modifies frames after handing them over.
         """
         self.width = width
         self.height = height
-        self.last_frame: Optional[Image.Image] = None
+        self.copy_on_store = copy_on_store
+        self.last_frame: Optional[Union[Image.Image, np.ndarray]] = None
         self.frame_count = 0
 
-    def show(self, image: Image.Image):
+    def show(self, image: Union[Image.Image, np.ndarray]):
         """Store the frame (doesn't actually display)."""
-        self.last_frame = image.copy()
+        self.last_frame = image.copy() if self.copy_on_store else image
         self.frame_count += 1
 
     def clear(self):
@@ -183,8 +505,12 @@ class MockDisplay:
         Args:
             path: File path to save to (e.g., 'frame.png')
         """
-        if self.last_frame:
-            self.last_frame.save(path)
+        if self.last_frame is None:
+            return
+        frame = self.last_frame
+        if isinstance(frame, np.ndarray):
+            frame = Image.fromarray(frame)
+        frame.save(path)
 
 
 class PreviewDisplay:
@@ -193,6 +519,8 @@ class PreviewDisplay:
 
     Useful for development on desktop systems.
     Requires a display environment (won't work over SSH without X forwarding).
+    The window is a single Tk window updated in place; closing it stops the
+    preview (later frames are ignored).
     """
 
     def __init__(self, width: int = 240, height: int = 320, scale: int = 2):
@@ -208,15 +536,44 @@ class PreviewDisplay:
         self.height = height
         self.scale = scale
         self._window_open = False
+        self._user_closed = False
+        self._root = None
+        self._photo = None
+
+    def _open_window(self):
+        """Create the Tk window and the photo image it displays."""
+        import tkinter as tk
+        from PIL import ImageTk
+
+        self._root = tk.Tk()
+        self._root.title("RoboEyes")
+        self._root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._photo = ImageTk.PhotoImage(
+            "RGB", (self.width * self.scale, self.height * self.scale)
+        )
+        tk.Label(self._root, image=self._photo, borderwidth=0).pack()
+        self._window_open = True
 
-    def show(self, image: Image.Image):
-        """Show the frame in a preview window."""
+    def _on_close(self):
+        """Handle the user closing the window."""
+        self._user_closed = True
+        self.cleanup()
+
+    def show(self, image: Union[Image.Image, np.ndarray]):
+        """Show the frame in the preview window."""
+        if self._user_closed:
+            return
+        if not self._window_open:
+            self._open_window()
+
+        # Integer nearest-neighbour upscale: just repeat rows and columns
+        rgb = np.asarray(image, dtype=np.uint8)
         if self.scale != 1:
-            image = image.resize(
-                (self.width * self.scale, self.height * self.scale),
-                Image.Resampling.NEAREST
-            )
-        image.show()
+            rgb = rgb.repeat(self.scale, axis=0).repeat(self.scale, axis=1)
+
+        self._photo.paste(Image.fromarray(rgb))
+        self._root.update_idletasks()
+        self._root.update()
 
     def clear(self):
         """No-op for preview display."""
@@ -227,5 +584,9 @@ class PreviewDisplay:
         pass
 
     def cleanup(self):
-        """No-op for preview display."""
-        pass
+        """Close the preview window."""
+        if self._window_open:
+            self._root.destroy()
+            self._root = None
+            self._photo = None
+            self._window_open = False
@@ -5,19 +5,16 @@ Simple RoboEyes Example - Basic usage on Waveshare 2" LCD.
 This is the minimal code needed to get animated eyes running.
 """
 
+import os
 import sys
 import time
 
-# Add Waveshare library path (adjust if needed)
-sys.path.insert(0, '/home/sam-pi/LCD_Module_RPI_code/RaspberryPi/python')
+# Running directly from the roboeyes folder: make the package importable
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import RoboEyes
-try:
-    from roboeyes import RoboEyes, Mood, WaveshareDisplay
-except ImportError:
-    # Running directly from the roboeyes folder
-    from eyes import RoboEyes, Mood
-    from display import WaveshareDisplay
+# Waveshare library location: set ROBOEYES_LCD_LIB if auto-detection misses it
+from roboeyes._bootstrap import RoboEyes, Mood, WaveshareDisplay, LCD_LIB_PATH
 
 
 def main():
@@ -39,21 +36,30 @@ def main():
         width=320,
         height=240,
         rotation=90,     # 90 for landscape, try 270 if upside down
-        backlight=50     # Brightness 0-100
+        backlight=50,    # Brightness 0-100
+        lib_path=LCD_LIB_PATH
     )
 
     print("RoboEyes running! Press Ctrl+C to stop.")
 
+    # Bind per-frame lookups to locals
+    update = eyes.update_ndarray
+    show = display.show
+    wait_for_frame = eyes.wait_for_frame
+    set_mood = eyes.set_mood
+    monotonic_ns = time.monotonic_ns
+    moods = (Mood.DEFAULT, Mood.HAPPY, Mood.ANGRY, Mood.TIRED)
+
     try:
         while True:
+            # Hold frame_rate; show() doesn't block, so nothing else will
+            wait_for_frame()
+
             # Get the next frame and display it
-            frame = eyes.update()
-            display.show(frame)
+            show(update())
 
             # Optional: cycle through moods every 10 seconds
-            mood_index = int(time.time() / 10) % 4
-            moods = [Mood.DEFAULT, Mood.HAPPY, Mood.ANGRY, Mood.TIRED]
-            eyes.set_mood(moods[mood_index])
+            set_mood(moods[monotonic_ns() // 10_000_000_000 % 4])
 
     except KeyboardInterrupt:
         print("\nStopping...")
@@ -5,7 +5,9 @@ Sam's Eye Loop - Large sky blue eyes cycling through moods.
 
 import sys
 import time
+import queue
 import random
+import threading
 
 # Add Waveshare library path
 sys.path.insert(0, '/home/sam-pi/LCD_Module_RPI_code/RaspberryPi/python')
@@ -58,27 +60,49 @@ def main():
     eyes.set_border_radius(border_radius)
     eyes.set_space_between(space_between)
 
-    # Create display
+    # Create display (synchronous: the loop below runs its own display thread)
     display = WaveshareDisplay(
         width=screen_width,
         height=screen_height,
         rotation=90,
-        backlight=50
+        backlight=50,
+        threaded=False
     )
 
+    # Render/SPI pipeline: the main thread renders the next frame while the
+    # display thread sends the changed region of the last one. eyes.stream()
+    # keeps a buffer intact for two more changed frames, which covers one in
+    # the queue plus one being sent; a full queue blocks (and paces) the
+    # renderer whenever the display falls behind.
+    ready_frames = queue.Queue(maxsize=1)
+
+    def display_loop():
+        while True:
+            item = ready_frames.get()
+            if item is None:
+                return
+            display.write_window(*item)
+
+    display_thread = threading.Thread(target=display_loop, daemon=True)
+    display_thread.start()
+
     print("Running! Press Ctrl+C to stop.")
 
     # Double-blink timing (2 to 3.5 seconds between double-blinks)
     def next_blink_time():
-        return time.time() + random.uniform(2.0, 3.5)
+        return time.monotonic() + random.uniform(2.0, 3.5)
 
     next_blink = next_blink_time()
     second_blink_pending = False
     second_blink_time = 0
 
     try:
-        while True:
-            now = time.time()
+        for buf, box in eyes.stream():
+            # Unchanged frames (eyes at rest) have nothing to send
+            if box is not None:
+                ready_frames.put((box, buf))
+
+            now = time.monotonic()
 
             # Check for double-blink
             if now >= next_blink and not second_blink_pending:
@@ -91,11 +115,10 @@ def main():
                 second_blink_pending = False
                 next_blink = next_blink_time()
 
-            frame = eyes.update()
-            display.show(frame)
-
     except KeyboardInterrupt:
         print("\nStopping...")
+        ready_frames.put(None)
+        display_thread.join()
         display.cleanup()
         print("Done!")
 
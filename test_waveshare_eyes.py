@@ -8,14 +8,22 @@ Usage:
     3. Run: python3 test_waveshare_eyes.py
 """
 
+import importlib.util
+import os
 import sys
 import time
 
 # Add Waveshare library path
 sys.path.insert(0, '/home/sam-pi/LCD_Module_RPI_code/RaspberryPi/python')
 
-# Import roboeyes (assumes roboeyes.py is in current directory)
-from roboeyes import RoboEyes, Mood
+# Import roboeyes.py from this script's directory by path: in the repo
+# checkout the roboeyes/ package sits next to it and would win a plain import
+_spec = importlib.util.spec_from_file_location(
+    'roboeyes', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'roboeyes.py'))
+roboeyes = importlib.util.module_from_spec(_spec)
+sys.modules['roboeyes'] = roboeyes
+_spec.loader.exec_module(roboeyes)
+RoboEyes, Mood = roboeyes.RoboEyes, roboeyes.Mood
 
 # Import Waveshare display wrapper
 from waveshare_display import WaveshareDisplay
@@ -25,8 +33,9 @@ def main():
     print("Initializing RoboEyes with Waveshare 2\" LCD...")
     
     # Create eyes renderer
-    # Note: Waveshare 2" is 240x320, but displayed in portrait mode
-    eyes = RoboEyes(width=240, height=320)
+    # Note: Waveshare 2" is 240x320, but displayed in portrait mode.
+    # Frames come out as RGB565 arrays, which the display sends as they are
+    eyes = RoboEyes(width=240, height=320, rgb565=True)
     
     # Create display
     display = WaveshareDisplay(
@@ -48,9 +57,15 @@ def main():
         start_time = time.time()
         
         while True:
-            # Update and render
-            frame = eyes.update()
-            display.show(frame)
+            # Render when a frame is due, sleeping until then rather than
+            # spinning; show() below never blocks, so this is the only wait
+            now = time.monotonic()
+            if not eyes.should_render(now):
+                time.sleep(max(0, eyes.last_frame_time + eyes.frame_time - now))
+                continue
+            # show() copies the frame and returns; the display's own thread
+            # sends it while the next one renders
+            display.show(eyes.render(now))
             
             frame_count += 1
             